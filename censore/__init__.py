@@ -1,4 +1,5 @@
 from .profanity_filter import ProfanityFilter
+from .compiled_filter import CompiledFilter
 
 
 class Censor(ProfanityFilter):
@@ -11,4 +12,4 @@ class Censor(ProfanityFilter):
     pass
 
 
-__all__ = ["ProfanityFilter", "Censor"]
+__all__ = ["ProfanityFilter", "CompiledFilter", "Censor"]
@@ -0,0 +1,227 @@
+import re
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from .utils.utils import _strip_chars, normalize_text, prepare_word, strip
+from .utils.matcher import PatternMatcher
+from .types import Word, Text
+
+
+# Matches a single whitespace-separated word
+_word_regex = re.compile(r"\S+")
+
+
+class CompiledFilter:
+    """
+    A profanity filter with its languages and custom patterns resolved ahead of time.
+
+    Created by `ProfanityFilter.compile`. Checking a text skips language resolution and
+    pattern merging entirely, which makes it the fastest way to process many texts with
+    the same settings. Patterns added to the `ProfanityFilter` afterwards are not picked up.
+
+    Attributes:
+        matcher: The pattern matcher used to detect profane words.
+    """
+
+    def __init__(
+        self, matcher: PatternMatcher, censor_word: Callable[..., Word]
+    ) -> None:
+        """
+        Initializes the compiled filter.
+
+        Args:
+            matcher: The pattern matcher used to detect profane words.
+            censor_word: The function used to censor a single profane word.
+        """
+        self.matcher = matcher
+        self._censor_word = censor_word
+
+    def _candidate_spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Finds the words of the text that contain a profanity pattern.
+
+        The normalized text is scanned once, and only the words around pattern
+        occurrences are returned, so clean words are never looked at individually.
+
+        Args:
+            text: The text to search.
+
+        Returns:
+            An iterator over the (start, end) spans of candidate words, in order.
+        """
+        normalized = normalize_text(text)
+
+        # Lowercasing a few characters changes the length of the text, and then
+        # positions in the normalized text don't line up with the original one
+        if len(normalized) != len(text):
+            if self.matcher.contains_pattern(normalized):
+                for match in _word_regex.finditer(text):
+                    yield match.span()
+
+            return
+
+        # End of the last word returned
+        scanned = 0
+
+        for start in self.matcher.find_patterns(normalized):
+            # Custom patterns can contain whitespace, so an occurrence may start
+            # between words or run into the next one. Only occurrences within a word
+            # matter, and each of them is reported by its own start.
+            if start < scanned or text[start].isspace():
+                continue
+
+            while start > 0 and not text[start - 1].isspace():
+                start -= 1
+
+            scanned = _word_regex.match(text, start).end()
+
+            yield start, scanned
+
+    def contains_profanity(self, text: str) -> bool:
+        """
+        Checks if the given text contains any profanity.
+
+        Args:
+            text: The text to be checked for profanity.
+
+        Returns:
+            True if the text contains profanity, False otherwise.
+        """
+        # Bind the lookups used for every word to locals
+        is_profane_word = self.matcher.is_profane
+        prepare = prepare_word
+
+        for start, end in self._candidate_spans(text):
+            if is_profane_word(prepare(text[start:end])):
+                return True
+
+        return False
+
+    def contains_profanity_batch(self, texts: Iterable[str]) -> List[bool]:
+        """
+        Checks each of the given texts for profanity.
+
+        Args:
+            texts: The texts to be checked for profanity.
+
+        Returns:
+            A list with True for each text that contains profanity and False otherwise.
+        """
+        contains_profanity = self.contains_profanity
+
+        return [contains_profanity(text) for text in texts]
+
+    def __call__(self, text: str) -> bool:
+        """
+        Checks if the given text contains any profanity, same as `contains_profanity`.
+
+        Lets a compiled filter be passed wherever a `Callable[[str], bool]` is expected,
+        e.g. to `filter()`.
+
+        Args:
+            text: The text to be checked for profanity.
+
+        Returns:
+            True if the text contains profanity, False otherwise.
+        """
+        return self.contains_profanity(text)
+
+    def censor(
+        self, text: str, partial_censor: bool = False, censor_symbol: str = "#"
+    ) -> Text:
+        """
+        Censors profane words in the given text.
+
+        Args:
+            text: The input text to be censored.
+            partial_censor: If True, partially censors the profane words. Defaults to False.
+            censor_symbol: The symbol used to replace profane words. Defaults to "#".
+
+        Returns:
+            The censored version of the input text.
+        """
+        words_censored: int = 0
+
+        # Bind the lookups used for every word to locals
+        is_profane_word = self.matcher.is_profane
+        censor_word = self._censor_word
+        prepare = prepare_word
+
+        # Words repeat a lot in real texts, so each distinct word is checked once.
+        # None marks words that are not profane.
+        censored_words: Dict[str, Optional[str]] = {}
+
+        def censor_token(word: str) -> Optional[str]:
+            if not is_profane_word(prepare(word)):
+                return None
+
+            stripped_word = strip(word)
+
+            censored_word = censor_word(
+                stripped_word,
+                partial_censor=partial_censor,
+                censoring_char=censor_symbol,
+            )
+
+            # Keep the punctuation stripped from the beginning and end of the word
+            start = len(word) - len(word.lstrip(_strip_chars))
+            end = start + len(stripped_word)
+
+            return word[:start] + censored_word.censored + word[end:]
+
+        # Pieces of the censored text, and the end of the original text copied so far
+        pieces: List[str] = []
+        copied = 0
+
+        for start, end in self._candidate_spans(text):
+            word = text[start:end]
+
+            if word in censored_words:
+                censored = censored_words[word]
+            else:
+                censored = censored_words[word] = censor_token(word)
+
+            if censored is None:
+                continue
+
+            pieces.append(text[copied:start])
+            pieces.append(censored)
+            copied = end
+            words_censored += 1
+
+        if pieces:
+            pieces.append(text[copied:])
+            censored_text = "".join(pieces)
+        else:
+            censored_text = text
+
+        is_profane: bool = words_censored > 0
+
+        return Text(
+            original=text,
+            censored=censored_text,
+            is_profane=is_profane,
+            words_censored=words_censored,
+        )
+
+    def censor_batch(
+        self,
+        texts: Iterable[str],
+        partial_censor: bool = False,
+        censor_symbol: str = "#",
+    ) -> List[Text]:
+        """
+        Censors profane words in each of the given texts.
+
+        Args:
+            texts: The input texts to be censored.
+            partial_censor: If True, partially censors the profane words. Defaults to False.
+            censor_symbol: The symbol used to replace profane words. Defaults to "#".
+
+        Returns:
+            The censored versions of the input texts, in the same order.
+        """
+        censor = self.censor
+
+        return [
+            censor(text, partial_censor=partial_censor, censor_symbol=censor_symbol)
+            for text in texts
+        ]
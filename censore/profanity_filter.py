@@ -1,13 +1,121 @@
 import os
-from typing import Optional, Dict, Set, Iterable
+from collections import OrderedDict
+from typing import Any, Optional, Dict, Set, FrozenSet, Iterable, List, Tuple, Type
 from functools import lru_cache
-from .utils.utils import load_patterns_from_file, normalize_word, strip
+from .utils.utils import load_patterns_from_file, normalize_patterns
+from .utils.matcher import get_pattern_matcher
+from .compiled_filter import CompiledFilter
 from .types import Word, Text
 
 
 # Path to the data folder containing pattern files
 data_folder: str = os.path.join(os.path.dirname(__file__), "data")
 
+# Key of combined pattern sets: (languages, custom patterns, custom exclude patterns)
+_PatternSetsKey = Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]
+
+# Combined pattern sets: {"patterns": ..., "exclude_patterns": ...}
+_PatternSets = Dict[str, FrozenSet[str]]
+
+# Maximum number of pattern sets and compiled filters each instance keeps. Custom
+# patterns passed per call are part of the key, so the caches must be bounded.
+_max_cached_pattern_sets: int = 32
+
+
+@lru_cache(maxsize=1)
+def _get_available_languages() -> FrozenSet[str]:
+    """
+    Lists the languages that have pattern files in the data folder.
+
+    The data folder doesn't change at runtime, so it is scanned only once.
+
+    Returns:
+        A set of available language codes.
+    """
+    return frozenset(
+        os.path.splitext(filename)[0]
+        for filename in os.listdir(os.path.join(data_folder, "patterns"))
+        if filename.endswith(".txt")
+    )
+
+
+# Not bounded: evicting a shared filter would silently replace it with a new one.
+# Keys are combinations of existing languages, since unknown ones raise ValueError.
+@lru_cache(maxsize=None)
+def _get_shared_filter(
+    filter_class: "Type[ProfanityFilter]", languages: FrozenSet[str]
+) -> CompiledFilter:
+    """
+    Creates the filter shared by all callers of `ProfanityFilter.default`.
+
+    Args:
+        filter_class: The filter class to instantiate.
+        languages: The languages to load.
+
+    Returns:
+        The shared compiled filter.
+    """
+    return filter_class(languages).compile()
+
+
+def _expand_languages(languages: Iterable[str]) -> FrozenSet[str]:
+    """
+    Replaces "all" in a list of languages with every available language.
+
+    Args:
+        languages: The language codes, possibly including "all".
+
+    Returns:
+        A set of language codes without "all".
+    """
+    languages = frozenset(languages)
+
+    if "all" in languages:
+        return (languages - {"all"}) | _get_available_languages()
+
+    return languages
+
+
+def _cache_result(
+    cache: "OrderedDict[_PatternSetsKey, Any]", key: _PatternSetsKey, value: Any
+) -> None:
+    """
+    Stores a value in a per-instance cache, evicting the least recently used entry
+    once the cache holds more than `_max_cached_pattern_sets` entries.
+
+    Args:
+        cache: The cache to store the value in.
+        key: The key to store the value under.
+        value: The value to store.
+    """
+    cache[key] = value
+
+    if len(cache) > _max_cached_pattern_sets:
+        cache.popitem(last=False)
+
+
+def _get_pattern_sets_key(
+    languages: Iterable[str],
+    custom_patterns: Optional[Iterable[str]],
+    custom_exclude_patterns: Optional[Iterable[str]],
+) -> _PatternSetsKey:
+    """
+    Builds the key under which combined pattern sets are cached.
+
+    Args:
+        languages: The languages to combine patterns for.
+        custom_patterns: Custom profanity patterns to include.
+        custom_exclude_patterns: Custom patterns to exclude.
+
+    Returns:
+        The cache key.
+    """
+    return (
+        frozenset(languages),
+        frozenset(custom_patterns or ()),
+        frozenset(custom_exclude_patterns or ()),
+    )
+
 
 class ProfanityFilter:
     """
@@ -15,7 +123,7 @@ class ProfanityFilter:
 
     Attributes:
         languages: Set of languages for which profanity patterns are loaded.
-        profanity_patterns: Dictionary storing profanity and exclusion patterns for each language.
+        profanity_patterns: Dictionary storing profanity and exclusion patterns for each loaded language.
     """
 
     def __init__(
@@ -33,13 +141,42 @@ class ProfanityFilter:
             custom_exclude_patterns: A list of custom patterns to exclude from profanity filtering. Defaults to an empty list.
         """
         self.languages: Set[str] = set()
-        self.profanity_patterns: Dict[str, Dict[str, Set[str]]] = dict()
+        self.profanity_patterns: Dict[str, Dict[str, FrozenSet[str]]] = dict()
+        self._pattern_sets_cache: "OrderedDict[_PatternSetsKey, _PatternSets]" = (
+            OrderedDict()
+        )
+        self._compiled_cache: "OrderedDict[_PatternSetsKey, CompiledFilter]" = (
+            OrderedDict()
+        )
+        # Filter compiled for calls without overrides, the most common case, and the
+        # languages it was compiled for. `languages` is public and can be changed
+        # directly, so the filter is only reused while they still match.
+        self._default_compiled: Optional[Tuple[FrozenSet[str], CompiledFilter]] = None
 
         self._load_languages(languages)
 
         if custom_patterns or custom_exclude_patterns:
             self.add_custom_profanity_patterns(custom_patterns, custom_exclude_patterns)
 
+    @classmethod
+    def default(cls, languages: Iterable[str] = frozenset(["all"])) -> CompiledFilter:
+        """
+        Returns a compiled filter for the given languages, shared by the whole process.
+
+        The filter is created on first use, so later calls skip loading patterns and
+        building matchers. It is a `CompiledFilter`, whose languages and patterns are
+        fixed, so no caller can change what the others see. The only state it changes is
+        the cache of words it has already checked. For other languages or custom
+        patterns, create your own `ProfanityFilter`.
+
+        Args:
+            languages: The languages to load. Defaults to frozenset(["all"]).
+
+        Returns:
+            The shared compiled filter.
+        """
+        return _get_shared_filter(cls, frozenset(languages))
+
     def _load_languages(
         self,
         languages: Iterable[str] = frozenset(),
@@ -48,8 +185,8 @@ class ProfanityFilter:
         """
         Loads language patterns for filtering.
 
-        If the list of languages contains "all", it loads patterns for all available languages,
-        using caching to improve performance.
+        If the list of languages contains "all", all available languages are registered, but
+        their pattern files are only read once patterns for a language are actually needed.
 
         Args:
             languages: List of language codes to load. If it contains "all",
@@ -60,12 +197,13 @@ class ProfanityFilter:
         Raises:
             ValueError: If patterns for the specified language are not found.
         """
-        if "all" in languages:
-            languages_for_loading = set(
-                os.path.splitext(filename)[0]
-                for filename in os.listdir(os.path.join(data_folder, "patterns"))
-                if filename.endswith(".txt")
-            )
+        if "all" in languages and not is_additional_language:
+            # Patterns are loaded lazily by _load_all_pattern_sets
+            self.languages.update(_get_available_languages())
+            self._default_compiled = None
+            languages_for_loading = frozenset(languages) - {"all"}
+        elif "all" in languages:
+            languages_for_loading = _get_available_languages()
         else:
             languages_for_loading = frozenset(languages)
 
@@ -81,12 +219,15 @@ class ProfanityFilter:
         """
         Loads profanity and exclusion patterns for a given language.
 
+        Languages that are already loaded, including ones loaded as additional languages,
+        are not loaded again.
+
         Args:
             language: The language for which to load the patterns.
             is_additional_language: Flag indicating whether the language is
                                     an additional language. Defaults to False.
         """
-        if language not in self.languages:
+        if language not in self.profanity_patterns:
             path_to_profanity_patterns = os.path.join(
                 data_folder, "patterns", f"{language}.txt"
             )
@@ -94,16 +235,16 @@ class ProfanityFilter:
                 data_folder, "exclude_patterns", f"{language}.txt"
             )
 
-            profanity_patterns = load_patterns_from_file(path_to_profanity_patterns)
-            exclude_patterns = load_patterns_from_file(path_to_exclude_patterns)
-
+            # The sets are frozen, so all instances share the ones cached by the loader
             self.profanity_patterns[language] = {
-                "patterns": set(profanity_patterns),
-                "exclude_patterns": set(exclude_patterns),
+                "patterns": load_patterns_from_file(path_to_profanity_patterns),
+                "exclude_patterns": load_patterns_from_file(path_to_exclude_patterns),
             }
+            self._clear_caches()
 
-            if not is_additional_language:
-                self.languages.update({language})
+        if not is_additional_language and language not in self.languages:
+            self.languages.add(language)
+            self._default_compiled = None
 
     def add_custom_profanity_patterns(
         self,
@@ -135,29 +276,49 @@ class ProfanityFilter:
             custom_patterns: A list of custom profanity patterns for the language.
             exclude_patterns: A list of patterns to exclude from the profanity filter for the language.
         """
+        custom_patterns = normalize_patterns(custom_patterns)
+        exclude_patterns = normalize_patterns(exclude_patterns)
+
         if language in self.profanity_patterns:
-            self.profanity_patterns[language]["patterns"].update(custom_patterns)
-            self.profanity_patterns[language]["exclude_patterns"].union(
-                exclude_patterns
+            # Build new sets rather than updating the existing ones, which may be shared
+            language_patterns = self.profanity_patterns[language]
+            language_patterns["patterns"] = (
+                language_patterns["patterns"] | custom_patterns
+            )
+            language_patterns["exclude_patterns"] = (
+                language_patterns["exclude_patterns"] | exclude_patterns
             )
 
         else:
             self.profanity_patterns[language] = {
-                "patterns": set(custom_patterns),
-                "exclude_patterns": set(exclude_patterns),
+                "patterns": custom_patterns,
+                "exclude_patterns": exclude_patterns,
             }
 
-        self.languages = self.languages.union({language})
+        self.languages.add(language)
+        self._clear_caches()
+
+    def _clear_caches(self) -> None:
+        """
+        Drops cached pattern sets and compiled filters after the loaded patterns change.
+        """
+        self._pattern_sets_cache.clear()
+        self._compiled_cache.clear()
+        self._default_compiled = None
 
     def _load_all_pattern_sets(
         self,
         languages: Optional[Iterable[str]] = None,
         custom_patterns: Optional[Iterable[str]] = frozenset(),
         custom_exclude_patterns: Optional[Iterable[str]] = frozenset(),
-    ) -> Dict[str, Set[str]]:
+    ) -> Dict[str, FrozenSet[str]]:
         """
         Load and combine profanity patterns and exclude patterns for the specified languages.
 
+        Languages that were registered but not loaded yet are loaded here. The combined sets
+        are cached until the loaded patterns change, so repeated calls with the same
+        arguments don't rebuild them.
+
         Args:
             languages: A list of language codes to load patterns for.
             custom_patterns: A list of custom profanity patterns to include. Defaults to an empty list.
@@ -171,25 +332,37 @@ class ProfanityFilter:
         Raises:
             ValueError: If no languages are specified for loading patterns.
         """
-        profanity_patterns: Set[str] = set()
-        exclude_patterns: Set[str] = set()
-
         if languages:
-            for language in languages:
-                patterns = self.profanity_patterns.get(language, {})
-                profanity_patterns.update(patterns.get("patterns", []))
-                exclude_patterns.update(patterns.get("exclude_patterns", []))
-
-            if custom_patterns:
-                profanity_patterns.update(frozenset(custom_patterns))
-
-            if custom_exclude_patterns:
-                exclude_patterns.update(frozenset(custom_exclude_patterns))
+            cache_key = _get_pattern_sets_key(
+                languages, custom_patterns, custom_exclude_patterns
+            )
 
-            return {
-                "patterns": profanity_patterns,
-                "exclude_patterns": exclude_patterns,
+            if cache_key in self._pattern_sets_cache:
+                self._pattern_sets_cache.move_to_end(cache_key)
+                return self._pattern_sets_cache[cache_key]
+
+            for language in cache_key[0]:
+                if language not in self.profanity_patterns:
+                    self._load_languages([language], is_additional_language=True)
+
+            language_patterns = [
+                self.profanity_patterns[language]
+                for language in cache_key[0]
+                if language in self.profanity_patterns
+            ]
+
+            # A single union over all sets merges them in C
+            pattern_sets = {
+                "patterns": normalize_patterns(cache_key[1]).union(
+                    *(patterns["patterns"] for patterns in language_patterns)
+                ),
+                "exclude_patterns": normalize_patterns(cache_key[2]).union(
+                    *(patterns["exclude_patterns"] for patterns in language_patterns)
+                ),
             }
+            _cache_result(self._pattern_sets_cache, cache_key, pattern_sets)
+
+            return pattern_sets
         else:
             raise ValueError("No languages specified for loading patterns")
 
@@ -197,104 +370,168 @@ class ProfanityFilter:
         self,
         languages: Optional[Iterable[str]] = None,
         additional_languages: Optional[Iterable[str]] = None,
-    ) -> Set[str]:
+    ) -> FrozenSet[str]:
         """
         Get the list of active languages based on the provided languages and additional languages.
 
+        Languages that are already loaded are not passed through loading again, so
+        repeated calls with the same languages, including "all", skip loading entirely.
+
         Args:
             languages: A list of languages to be activated. If "all" is included, all available languages will be activated.
             additional_languages: A list of additional languages to be added to the active languages.
 
         Returns:
-            A list of active languages.
+            A set of active languages.
         """
-        active_languages = self.languages
-
-        if languages:
+        # "all" is passed on unexpanded, so that the languages are loaded lazily
+        if languages and not _expand_languages(languages) <= self.languages:
             self._load_languages(languages)
-            if not "all" in languages:
-                active_languages.update(languages)
 
         if additional_languages:
-            self._load_languages(additional_languages, is_additional_language=True)
-            active_languages.union(additional_languages)
+            additional_languages = _expand_languages(additional_languages)
 
-        return active_languages
+            if not additional_languages <= self.profanity_patterns.keys():
+                self._load_languages(additional_languages, is_additional_language=True)
 
-    def contains_profanity(
+            return frozenset(self.languages | additional_languages)
+
+        return frozenset(self.languages)
+
+    def compile(
         self,
-        text: str,
         languages: Optional[Iterable[str]] = None,
         additional_languages: Optional[Iterable[str]] = None,
         custom_patterns: Optional[Iterable[str]] = None,
         custom_exclude_patterns: Optional[Iterable[str]] = None,
-    ) -> bool:
+    ) -> CompiledFilter:
         """
-        Checks if the given text contains any profanity.
+        Resolves languages and patterns once and returns a filter bound to them.
+
+        Use it to check or censor many texts with the same settings: the returned filter
+        skips language resolution and pattern merging on every call. Compiled filters are
+        cached until the loaded patterns change.
 
         Args:
-            text: The text to be checked for profanity.
             languages: List of languages to consider for profanity. Defaults to None.
             additional_languages: Additional languages to consider for profanity. Defaults to None.
             custom_patterns: Custom patterns to be considered as profanity. Defaults to an empty list.
             custom_exclude_patterns: Custom patterns to be excluded from profanity. Defaults to an empty list.
 
         Returns:
-            True if the text contains profanity, False otherwise.
+            The compiled filter.
         """
+        is_default = not (
+            languages
+            or additional_languages
+            or custom_patterns
+            or custom_exclude_patterns
+        )
+
+        # Without overrides the filter only depends on the instance state, so there
+        # is no need to resolve languages or build a cache key
+        if is_default and self._default_compiled is not None:
+            default_languages, compiled = self._default_compiled
+            if default_languages == self.languages:
+                return compiled
+
         active_languages = self._get_active_languages(languages, additional_languages)
 
-        all_patterns = self._load_all_pattern_sets(
+        cache_key = _get_pattern_sets_key(
             active_languages, custom_patterns, custom_exclude_patterns
         )
 
-        profanity_patterns = frozenset(all_patterns["patterns"])
-        exclude_patterns = frozenset(all_patterns["exclude_patterns"])
+        if cache_key in self._compiled_cache:
+            self._compiled_cache.move_to_end(cache_key)
+            compiled = self._compiled_cache[cache_key]
+        else:
+            compiled = self._compile_pattern_sets(
+                active_languages, custom_patterns, custom_exclude_patterns
+            )
+            _cache_result(self._compiled_cache, cache_key, compiled)
+
+        if is_default:
+            self._default_compiled = (frozenset(self.languages), compiled)
 
-        words = text.split()
+        return compiled
 
-        for word in words:
-            if self._is_profane_word(
-                word,
-                profanity_patterns=profanity_patterns,
-                exclude_patterns=exclude_patterns,
-            ):
-                return True
+    def _compile_pattern_sets(
+        self,
+        languages: Iterable[str],
+        custom_patterns: Optional[Iterable[str]],
+        custom_exclude_patterns: Optional[Iterable[str]],
+    ) -> CompiledFilter:
+        """
+        Combines the patterns for the given languages and compiles them into a filter.
 
-        return False
+        Args:
+            languages: The active languages.
+            custom_patterns: Custom patterns to be considered as profanity.
+            custom_exclude_patterns: Custom patterns to be excluded from profanity.
 
-    @lru_cache(maxsize=None)
-    def _is_profane_word(
+        Returns:
+            The compiled filter.
+        """
+        all_patterns = self._load_all_pattern_sets(
+            languages, custom_patterns, custom_exclude_patterns
+        )
+
+        matcher = get_pattern_matcher(
+            all_patterns["patterns"], all_patterns["exclude_patterns"]
+        )
+
+        return CompiledFilter(matcher, self.censor_word)
+
+    def contains_profanity(
         self,
-        word: str,
-        profanity_patterns: Iterable[str],
-        exclude_patterns: Iterable[str],
+        text: str,
+        languages: Optional[Iterable[str]] = None,
+        additional_languages: Optional[Iterable[str]] = None,
+        custom_patterns: Optional[Iterable[str]] = None,
+        custom_exclude_patterns: Optional[Iterable[str]] = None,
     ) -> bool:
         """
-        Check if a given word is considered profane based on provided patterns.
+        Checks if the given text contains any profanity.
 
         Args:
-            word: The word to check for profanity.
-            profanity_patterns: A set of patterns that define profane words.
-            exclude_patterns: A set of patterns that define words to exclude from being considered profane.
+            text: The text to be checked for profanity.
+            languages: List of languages to consider for profanity. Defaults to None.
+            additional_languages: Additional languages to consider for profanity. Defaults to None.
+            custom_patterns: Custom patterns to be considered as profanity. Defaults to an empty list.
+            custom_exclude_patterns: Custom patterns to be excluded from profanity. Defaults to an empty list.
 
         Returns:
-            True if the word is considered profane, False otherwise.
+            True if the text contains profanity, False otherwise.
         """
-        normalized_word = normalize_word(strip(word))
+        return self.compile(
+            languages, additional_languages, custom_patterns, custom_exclude_patterns
+        ).contains_profanity(text)
 
-        for pattern in exclude_patterns:
-            if pattern in normalized_word:
-                return False
+    def contains_profanity_batch(
+        self,
+        texts: Iterable[str],
+        languages: Optional[Iterable[str]] = None,
+        additional_languages: Optional[Iterable[str]] = None,
+        custom_patterns: Optional[Iterable[str]] = None,
+        custom_exclude_patterns: Optional[Iterable[str]] = None,
+    ) -> List[bool]:
+        """
+        Checks each of the given texts for profanity, resolving the settings only once.
 
-        for profanity_pattern in profanity_patterns:
-            if profanity_pattern in normalized_word:
-                return True
+        Args:
+            texts: The texts to be checked for profanity.
+            languages: List of languages to consider for profanity. Defaults to None.
+            additional_languages: Additional languages to consider for profanity. Defaults to None.
+            custom_patterns: Custom patterns to be considered as profanity. Defaults to an empty list.
+            custom_exclude_patterns: Custom patterns to be excluded from profanity. Defaults to an empty list.
 
-        # Temporary type fix
-        return False
+        Returns:
+            A list with True for each text that contains profanity and False otherwise.
+        """
+        return self.compile(
+            languages, additional_languages, custom_patterns, custom_exclude_patterns
+        ).contains_profanity_batch(texts)
 
-    @lru_cache(maxsize=None)
     def censor_word(
         self, word: str, partial_censor: bool = False, censoring_char: str = "#"
     ) -> Word:
@@ -345,48 +582,37 @@ class ProfanityFilter:
         Returns:
             The censored version of the input text.
         """
-        active_languages = self._get_active_languages(
-            languages,
-            additional_languages,
-        )
+        return self.compile(
+            languages, additional_languages, custom_patterns, custom_exclude_patterns
+        ).censor(text, partial_censor=partial_censor, censor_symbol=censor_symbol)
 
-        all_patterns = self._load_all_pattern_sets(
-            active_languages, custom_patterns, custom_exclude_patterns
-        )
+    def censor_batch(
+        self,
+        texts: Iterable[str],
+        languages: Optional[Iterable[str]] = None,
+        additional_languages: Optional[Iterable[str]] = None,
+        custom_patterns: Optional[Iterable[str]] = None,
+        custom_exclude_patterns: Optional[Iterable[str]] = None,
+        partial_censor: bool = False,
+        censor_symbol: str = "#",
+    ) -> List[Text]:
+        """
+        Censors profane words in each of the given texts, resolving the settings only once.
 
-        profanity_patterns = frozenset(all_patterns["patterns"])
-        exclude_patterns = frozenset(all_patterns["exclude_patterns"])
-
-        words = text.split()
-        censored_text = text
-        is_profane: bool = False
-        words_censored: int = 0
-
-        for word in words:
-            stripped_word = strip(word)
-
-            if self._is_profane_word(
-                word,
-                profanity_patterns=profanity_patterns,
-                exclude_patterns=exclude_patterns,
-            ):
-                is_profane = True
-
-                censored_word = self.censor_word(
-                    stripped_word,
-                    partial_censor=partial_censor,
-                    censoring_char=censor_symbol,
-                )
-
-                censored_text = censored_text.replace(
-                    stripped_word, censored_word.censored
-                )
-
-                words_censored += 1
-
-        return Text(
-            original=text,
-            censored=censored_text,
-            is_profane=is_profane,
-            words_censored=words_censored,
+        Args:
+            texts: The input texts to be censored.
+            languages: List of languages to use for profanity detection.
+            additional_languages: Additional languages to include for profanity detection.
+            custom_patterns: List of custom patterns to be considered as profane.
+            custom_exclude_patterns: List of custom patterns to be excluded from being considered as profane.
+            partial_censor: If True, partially censors the profane words. Defaults to False.
+            censor_symbol: The symbol used to replace profane words. Defaults to "#".
+
+        Returns:
+            The censored versions of the input texts, in the same order.
+        """
+        return self.compile(
+            languages, additional_languages, custom_patterns, custom_exclude_patterns
+        ).censor_batch(
+            texts, partial_censor=partial_censor, censor_symbol=censor_symbol
         )
@@ -3,13 +3,22 @@ from .utils import (
     # _strip_chars,
     load_patterns_from_file,
     normalize_word,
+    normalize_text,
+    normalize_patterns,
+    prepare_word,
     strip,
 )
+from .matcher import PatternMatcher, get_pattern_matcher
 
 __all__ = [
     # "_substitution_table",
     # "_strip_chars",
     "load_patterns_from_file",
     "normalize_word",
+    "normalize_text",
+    "normalize_patterns",
+    "prepare_word",
     "strip",
+    "PatternMatcher",
+    "get_pattern_matcher",
 ]
@@ -0,0 +1,344 @@
+import re
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+)
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+# Deepest nesting of groups in the trie regex. The regex compiler recurses into
+# nested groups, so deeper tries are compiled as a flat alternation instead.
+_max_regex_depth: int = 100
+
+# Maximum number of words whose result each matcher remembers. Once the cache is
+# full, new words are still checked but no longer stored. Nothing is evicted, so
+# the words seen first keep their cached results.
+_max_profane_cache: int = 1 << 16
+
+
+def _build_automaton(patterns: FrozenSet[str]) -> Any:
+    """
+    Builds an Aho-Corasick automaton for the given patterns.
+
+    Args:
+        patterns: The patterns to add to the automaton.
+
+    Returns:
+        The automaton. Requires `pyahocorasick` to be installed.
+    """
+    automaton = ahocorasick.Automaton()
+
+    # The pattern length is stored to find where a match starts
+    for pattern in patterns:
+        automaton.add_word(pattern, len(pattern))
+
+    automaton.make_automaton()
+
+    return automaton
+
+
+def _build_trie(patterns: FrozenSet[str]) -> Dict[str, Any]:
+    """
+    Builds a character trie for the given patterns.
+
+    Args:
+        patterns: The patterns to add to the trie.
+
+    Returns:
+        The root node of the trie. Each node maps a character to its child node,
+        and the "" key marks the end of a pattern.
+    """
+    trie: Dict[str, Any] = {}
+
+    for pattern in patterns:
+        node = trie
+
+        for char in pattern:
+            node = node.setdefault(char, {})
+
+        node[""] = {}
+
+    return trie
+
+
+def _trie_to_regex(trie: Dict[str, Any]) -> Optional[str]:
+    """
+    Converts a trie into a regular expression that matches any of its patterns.
+
+    The trie is walked with an explicit stack rather than recursion, since patterns can
+    be longer than the interpreter's recursion limit.
+
+    Args:
+        trie: The root node of the trie to convert.
+
+    Returns:
+        The regular expression source, or None if its groups would be nested deeper
+        than `_max_regex_depth`.
+    """
+    # Regular expressions of the nodes converted so far and the depth of their
+    # nested groups, by node id
+    node_regexes: Dict[int, Tuple[str, int]] = {}
+    stack: List[Tuple[Dict[str, Any], bool]] = [(trie, False)]
+
+    while stack:
+        node, children_converted = stack.pop()
+
+        # Once a pattern ends, longer patterns sharing its prefix can't change whether
+        # the text matches, so they are left out
+        if "" in node:
+            node_regexes[id(node)] = ("", 0)
+            continue
+
+        # Convert the children first, then come back to this node
+        if not children_converted:
+            stack.append((node, True))
+            stack.extend((child, False) for child in node.values())
+            continue
+
+        branches: List[str] = []
+        chars: List[str] = []
+        depth = 0
+
+        for char, child in sorted(node.items()):
+            child_regex, child_depth = node_regexes.pop(id(child))
+            depth = max(depth, child_depth)
+
+            if child_regex:
+                branches.append(re.escape(char) + child_regex)
+            else:
+                chars.append(re.escape(char))
+
+        if len(chars) == 1:
+            branches.append(chars[0])
+        elif chars:
+            branches.append(f"[{''.join(chars)}]")
+
+        if len(branches) == 1:
+            node_regexes[id(node)] = (branches[0], depth)
+        elif depth < _max_regex_depth:
+            node_regexes[id(node)] = (f"(?:{'|'.join(branches)})", depth + 1)
+        else:
+            return None
+
+    return node_regexes[id(trie)][0]
+
+
+def _build_regex(patterns: FrozenSet[str]) -> Pattern[str]:
+    """
+    Compiles the given patterns into a single regular expression.
+
+    The patterns are arranged as a trie, with common prefixes factored out, so at each
+    position of the text the regex engine follows one branch per character instead of
+    trying every pattern in turn. The regex compiler recurses into nested groups, so
+    if the trie is nested too deeply, a flat alternation is used instead.
+
+    Args:
+        patterns: The patterns to compile.
+
+    Returns:
+        The compiled regular expression.
+    """
+    regex = _trie_to_regex(_build_trie(patterns))
+
+    if regex is None:
+        regex = "|".join(map(re.escape, sorted(patterns)))
+
+    return re.compile(regex)
+
+
+def _build_scanners(
+    patterns: FrozenSet[str],
+) -> Tuple[Callable[[str], bool], Callable[[str], Iterator[int]]]:
+    """
+    Builds functions that scan a text for the given patterns.
+
+    Uses an Aho-Corasick automaton if `pyahocorasick` is installed, and a compiled
+    regular expression otherwise. Either way the text is scanned once in C,
+    no matter how many patterns there are.
+
+    Args:
+        patterns: The patterns to search for.
+
+    Returns:
+        A tuple of two functions that take a text:
+            - The first returns True if the text contains any of the patterns.
+            - The second yields the start index of pattern occurrences, ordered by
+              where either the occurrences start or where they end. Every run of
+              non-whitespace characters that contains an occurrence also contains
+              one of the yielded indexes.
+    """
+    if not patterns:
+        return lambda text: False, lambda text: iter(())
+
+    if ahocorasick is not None:
+        automaton = _build_automaton(patterns)
+
+        def find_automaton(text: str) -> Iterator[int]:
+            for end, length in automaton.iter(text):
+                yield end - length + 1
+
+        return (
+            lambda text: next(automaton.iter(text), None) is not None,
+            find_automaton,
+        )
+
+    regex = _build_regex(patterns)
+
+    if any(char.isspace() for pattern in patterns for char in pattern):
+        # finditer doesn't return overlapping matches, and a match running into the
+        # next word would hide the patterns in that word. Trying a zero-width
+        # lookahead at every position reports all of them instead.
+        find_regex = re.compile(f"(?={regex.pattern})").finditer
+    else:
+        # Non-overlapping matches are enough when patterns have no whitespace,
+        # since a match can then only hide occurrences in its own word
+        find_regex = regex.finditer
+
+    def find_starts(text: str) -> Iterator[int]:
+        for match in find_regex(text):
+            yield match.start()
+
+    return lambda text: regex.search(text) is not None, find_starts
+
+
+class PatternMatcher:
+    """
+    Matches normalized text against a fixed set of profanity and exclude patterns.
+
+    If `pyahocorasick` is installed, the patterns are compiled into Aho-Corasick
+    automatons, otherwise into regular expression alternations. Either way a single
+    pass over the text finds an occurrence of any pattern, regardless of how many
+    patterns are loaded.
+
+    Attributes:
+        patterns: The profanity patterns.
+        exclude_patterns: Patterns that prevent a word from being considered profane.
+    """
+
+    __slots__ = (
+        "patterns",
+        "exclude_patterns",
+        "_search",
+        "_find",
+        "_search_exclude",
+        "_profane_cache",
+        "__weakref__",
+    )
+
+    def __init__(
+        self, patterns: Iterable[str], exclude_patterns: Iterable[str]
+    ) -> None:
+        """
+        Initializes the matcher and compiles the patterns.
+
+        Args:
+            patterns: The profanity patterns.
+            exclude_patterns: Patterns that prevent a word from being considered profane.
+        """
+        self.patterns: FrozenSet[str] = frozenset(patterns)
+        self.exclude_patterns: FrozenSet[str] = frozenset(exclude_patterns)
+
+        self._search, self._find = _build_scanners(self.patterns)
+        self._search_exclude, _ = _build_scanners(self.exclude_patterns)
+
+        # Results of is_profane, keyed by word only since the patterns never change
+        self._profane_cache: Dict[str, bool] = {}
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Pickles the matcher as its pattern sets.
+
+        The compiled scanners are closures that can't be pickled, so they are rebuilt,
+        or taken from the cache, when the matcher is unpickled.
+
+        Returns:
+            The function recreating the matcher and its arguments.
+        """
+        return (get_pattern_matcher, (self.patterns, self.exclude_patterns))
+
+    def contains_pattern(self, text: str) -> bool:
+        """
+        Checks if the text contains any profanity pattern, ignoring exclude patterns.
+
+        Args:
+            text: The normalized text to search.
+
+        Returns:
+            True if any profanity pattern occurs in the text, False otherwise.
+        """
+        return self._search(text)
+
+    def find_patterns(self, text: str) -> Iterator[int]:
+        """
+        Finds where profanity patterns occur in the text, ignoring exclude patterns.
+
+        Args:
+            text: The normalized text to search.
+
+        Returns:
+            An iterator over start indexes of pattern occurrences, ordered by where the
+            occurrences start or end. Every run of non-whitespace characters that
+            contains an occurrence also contains one of the indexes.
+        """
+        return self._find(text)
+
+    def contains_exclude_pattern(self, text: str) -> bool:
+        """
+        Checks if the text contains any exclude pattern.
+
+        Args:
+            text: The normalized text to search.
+
+        Returns:
+            True if any exclude pattern occurs in the text, False otherwise.
+        """
+        return self._search_exclude(text)
+
+    def is_profane(self, word: str) -> bool:
+        """
+        Checks if a normalized word is profane.
+
+        Args:
+            word: The normalized word to check.
+
+        Returns:
+            True if the word contains a profanity pattern and no exclude pattern, False otherwise.
+        """
+        if word in self._profane_cache:
+            return self._profane_cache[word]
+
+        is_profane = not self._search_exclude(word) and self._search(word)
+
+        if len(self._profane_cache) < _max_profane_cache:
+            self._profane_cache[word] = is_profane
+
+        return is_profane
+
+
+@lru_cache(maxsize=32)
+def get_pattern_matcher(
+    patterns: FrozenSet[str], exclude_patterns: FrozenSet[str]
+) -> PatternMatcher:
+    """
+    Returns a cached `PatternMatcher` for the given pattern sets.
+
+    Args:
+        patterns: The profanity patterns.
+        exclude_patterns: Patterns that prevent a word from being considered profane.
+
+    Returns:
+        The pattern matcher.
+    """
+    return PatternMatcher(patterns, exclude_patterns)
@@ -1,39 +1,60 @@
+import string
+import sys
 from functools import lru_cache
-from typing import Dict, FrozenSet
-
-_substitution_table: Dict[int, str] = str.maketrans(
-    {
-        "0": "o",
-        "1": "i",
-        "@": "a",
-        "$": "s",
-        "3": "e",
-        "5": "s",
-        "7": "t",
-        "8": "b",
-    }
+from typing import Dict, FrozenSet, Iterable
+
+_substitutions: Dict[str, str] = {
+    "0": "o",
+    "1": "i",
+    "@": "a",
+    "$": "s",
+    "3": "e",
+    "5": "s",
+    "7": "t",
+    "8": "b",
+}
+
+_substitution_table: Dict[int, str] = str.maketrans(_substitutions)
+
+# The same substitutions as a 256-byte table, used for ASCII-only text.
+# It also maps uppercase letters to lowercase, so no separate lower() pass is needed.
+_ascii_substitution_table: bytes = bytes.maketrans(
+    ("".join(_substitutions.keys()) + string.ascii_uppercase).encode("ascii"),
+    ("".join(_substitutions.values()) + string.ascii_lowercase).encode("ascii"),
 )
 
 _strip_chars = ".,!?:;/()[]{}-"
+_ascii_strip_chars: bytes = _strip_chars.encode("ascii")
+
+# Maximum number of distinct words each word-level lru_cache keeps before evicting
+# the least recently used. Texts can contain any number of distinct words, so the
+# caches must not grow without limit.
+_max_normalized_words: int = 1 << 14
+
+# Maximum number of parsed pattern files kept, two per language
+_max_cached_files: int = 32
 
 
-@lru_cache(maxsize=None)
+@lru_cache(maxsize=_max_cached_files)
 def load_patterns_from_file(filepath: str) -> FrozenSet[str]:
     """
-    Loads patterns from a file and caches the result.
+    Loads patterns from a file, normalizes them and caches the result.
+
+    The cache is shared by all filter instances, so each file is normally read and parsed once per process.
 
     Args:
         filepath: The path to the pattern file.
 
     Returns:
-        A set of patterns loaded from the file.
+        A set of normalized patterns loaded from the file.
     """
-    with open(filepath, "r", encoding="utf-8") as file:
-        patterns = frozenset(file.read().split())
+    # Read raw bytes and decode them in one go, skipping the text-mode wrapper
+    with open(filepath, "rb") as file:
+        patterns = normalize_patterns(file.read().decode("utf-8").split())
     return patterns
 
 
-@lru_cache(maxsize=None)
+@lru_cache(maxsize=_max_normalized_words)
 def normalize_word(word: str) -> str:
     """
     Normalize a word by translating it using the substitution table and converting it to lowercase.
@@ -44,10 +65,16 @@ def normalize_word(word: str) -> str:
     Returns:
         The normalized word.
     """
-    return word.translate(_substitution_table).lower()
+    try:
+        ascii_word = word.encode("ascii")
+    except UnicodeEncodeError:
+        return word.translate(_substitution_table).lower()
+
+    # bytes.translate uses a flat lookup table, which is faster than str.translate
+    return ascii_word.translate(_ascii_substitution_table).decode("ascii")
 
 
-@lru_cache(maxsize=None)
+@lru_cache(maxsize=_max_normalized_words)
 def strip(word: str) -> str:
     """
     Strips specified punctuation characters from the beginning and end of the given word.
@@ -59,3 +86,73 @@ def strip(word: str) -> str:
         The word with specified punctuation characters removed from its beginning and end.
     """
     return word.strip(_strip_chars)
+
+
+@lru_cache(maxsize=_max_normalized_words)
+def prepare_word(word: str) -> str:
+    """
+    Strips punctuation from a word and normalizes it, ready for pattern matching.
+
+    Equivalent to `normalize_word(strip(word))`, but done in a single call with a single cache lookup.
+
+    Args:
+        word: The word to be prepared.
+
+    Returns:
+        The stripped and normalized word.
+    """
+    try:
+        ascii_word = word.encode("ascii")
+    except UnicodeEncodeError:
+        return word.strip(_strip_chars).translate(_substitution_table).lower()
+
+    return (
+        ascii_word.strip(_ascii_strip_chars)
+        .translate(_ascii_substitution_table)
+        .decode("ascii")
+    )
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize a whole text the same way `normalize_word` normalizes a single word.
+
+    Unlike `normalize_word`, the result is not cached, since whole texts rarely repeat.
+
+    Args:
+        text: The text to be normalized.
+
+    Returns:
+        The normalized text.
+    """
+    try:
+        ascii_text = text.encode("ascii")
+    except UnicodeEncodeError:
+        return text.translate(_substitution_table).lower()
+
+    normalized_text = ascii_text.translate(_ascii_substitution_table)
+
+    # Most texts are already normalized, so return them as is instead of decoding a copy
+    if normalized_text == ascii_text:
+        return text
+
+    return normalized_text.decode("ascii")
+
+
+def normalize_patterns(patterns: Iterable[str]) -> FrozenSet[str]:
+    """
+    Normalize patterns the same way words are normalized before matching.
+
+    Patterns that are empty after stripping are dropped, since they would match every word.
+    The remaining patterns are interned, so languages sharing a pattern share one string.
+
+    Args:
+        patterns: The patterns to be normalized.
+
+    Returns:
+        A set of normalized patterns.
+    """
+    normalized_patterns = frozenset(
+        sys.intern(prepare_word(pattern)) for pattern in patterns
+    )
+    return normalized_patterns - frozenset([""])
@@ -1,3 +1,4 @@
+from pathlib import Path
 from setuptools import setup, find_packages
 
 setup(
@@ -5,7 +6,7 @@ setup(
     # noqa
     version="0.2.1",
     description="A package for censoring profanity in text",
-    long_description=open("README.md").read(),
+    long_description=(Path(__file__).parent / "README.md").read_text(encoding="utf-8"),
     long_description_content_type="text/markdown",
     author="Okinea Dev",
     url="https://github.com/censor-text/censore",
@@ -13,6 +14,7 @@ setup(
     package_data={"": ["data/**/*.txt"]},
     include_package_data=True,
     install_requires=[],
+    extras_require={"fast": ["pyahocorasick"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
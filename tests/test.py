@@ -1,11 +1,19 @@
+import pickle
 import unittest
-from censore import ProfanityFilter
+import weakref
+from unittest import mock
+from censore import CompiledFilter, ProfanityFilter
 from censore.types import Text, Word
+from censore.utils import matcher
+from censore.utils.matcher import get_pattern_matcher
 
 
 class TestProfanityFilter(unittest.TestCase):
 
     def setUp(self):
+        # Matchers are cached per process, drop the ones built by other test cases
+        get_pattern_matcher.cache_clear()
+        self.addCleanup(get_pattern_matcher.cache_clear)
         self.filter = ProfanityFilter()
 
     # def test_contains_profanity(self):
@@ -26,6 +34,42 @@ class TestProfanityFilter(unittest.TestCase):
             self.filter.contains_profanity(non_profane_word, languages=["en"])
         )
 
+    def test_all_languages_loaded_lazily(self):
+        profanity_filter = ProfanityFilter()
+        self.assertIn("uk", profanity_filter.languages)
+        self.assertNotIn("uk", profanity_filter.profanity_patterns)
+        self.assertTrue(profanity_filter.contains_profanity("хуй"))
+        self.assertIn("uk", profanity_filter.profanity_patterns)
+
+    def test_additional_languages(self):
+        profanity_filter = ProfanityFilter(languages=["en"])
+        self.assertTrue(
+            profanity_filter.contains_profanity("хуй", additional_languages=["uk"])
+        )
+        self.assertNotIn("uk", profanity_filter.languages)
+        self.assertFalse(profanity_filter.contains_profanity("хуй"))
+
+    def test_languages_added_by_check(self):
+        profanity_filter = ProfanityFilter(languages=["en"])
+        self.assertFalse(profanity_filter.contains_profanity("хуй"))
+        profanity_filter.contains_profanity("good", languages=["uk"])
+        self.assertTrue(profanity_filter.contains_profanity("хуй"))
+
+    def test_languages_changed_directly(self):
+        profanity_filter = ProfanityFilter(languages=["en", "uk"])
+        self.assertTrue(profanity_filter.contains_profanity("хуй"))
+        profanity_filter.languages.discard("uk")
+        self.assertFalse(profanity_filter.contains_profanity("хуй"))
+        profanity_filter.languages.add("uk")
+        self.assertTrue(profanity_filter.contains_profanity("хуй"))
+
+    def test_default(self):
+        shared = ProfanityFilter.default(["en"])
+        self.assertIs(shared, ProfanityFilter.default(["en"]))
+        self.assertIsInstance(shared, CompiledFilter)
+        self.assertTrue(shared.contains_profanity("fuck"))
+        self.assertFalse(shared.contains_profanity("хуй"))
+
     def test_censor_word(self):
         word = "fuck"
         censored = self.filter.censor_word(word)
@@ -46,6 +90,123 @@ class TestProfanityFilter(unittest.TestCase):
         self.assertIn("#######", censored.censored)
         self.assertNotIn("fucking", censored.censored)
 
+    def test_censor_repeated_pattern(self):
+        text = "fuck  fucking, cocktail"
+        censored = self.filter.censor(
+            text, languages=["en"], custom_exclude_patterns=["cocktail"]
+        )
+        self.assertEqual("####  #######, cocktail", censored.censored)
+        self.assertEqual(2, censored.words_censored)
+
+    def test_censor_pattern_crossing_words(self):
+        censored = self.filter.censor(
+            "go fuck yourself", languages=["en"], custom_patterns=["go fuck"]
+        )
+        self.assertEqual("go #### yourself", censored.censored)
+        censored = self.filter.censor(
+            "foo bar", languages=["en"], custom_patterns=["o b", "bar"]
+        )
+        self.assertEqual("foo ###", censored.censored)
+        self.assertTrue(
+            self.filter.contains_profanity(
+                "foo bar", languages=["en"], custom_patterns=["o b", "bar"]
+            )
+        )
+        self.assertFalse(
+            self.filter.contains_profanity(
+                "good day", languages=["en"], custom_patterns=[" day"]
+            )
+        )
+        censored = self.filter.censor(
+            "go fuck", languages=["en"], custom_patterns=[" fuck"]
+        )
+        self.assertEqual("go ####", censored.censored)
+        self.assertTrue(
+            self.filter.contains_profanity(
+                "go fuck", languages=["en"], custom_patterns=[" fuck"]
+            )
+        )
+        censored = self.filter.censor(
+            "go fuck", languages=["en"], custom_patterns=["go "]
+        )
+        self.assertEqual("go ####", censored.censored)
+
+    def test_long_custom_patterns(self):
+        self.assertTrue(
+            self.filter.contains_profanity(
+                "x" * 1200, languages=["en"], custom_patterns=["x" * 1200]
+            )
+        )
+        # Patterns branching at every character nest the trie deeply
+        custom_patterns = ["x" * i + "yz" for i in range(200)]
+        self.assertTrue(
+            self.filter.contains_profanity(
+                "x" * 199 + "yz", languages=["en"], custom_patterns=custom_patterns
+            )
+        )
+        self.assertFalse(
+            self.filter.contains_profanity(
+                "x" * 199 + "y", languages=["en"], custom_patterns=custom_patterns
+            )
+        )
+
+    def test_censor_changed_length_text(self):
+        # "İ" lowercases to two characters, so the normalized text is longer
+        text = "İstanbul fuck"
+        censored = self.filter.censor(text, languages=["en"])
+        self.assertEqual("İstanbul ####", censored.censored)
+        self.assertEqual(1, censored.words_censored)
+
+    def test_censor_clean_text(self):
+        text = "This is a very good text."
+        censored = self.filter.censor(text, languages=["en"])
+        self.assertEqual(
+            Text(original=text, censored=text, is_profane=False, words_censored=0),
+            censored,
+        )
+
+    def test_compile(self):
+        compiled = self.filter.compile(languages=["en"])
+        self.assertTrue(compiled.contains_profanity("fuck"))
+        self.assertFalse(compiled.contains_profanity("good"))
+        self.assertEqual("f##k", compiled.censor("fuck", partial_censor=True).censored)
+        self.assertEqual([False, True], list(map(compiled, ["good", "fuck"])))
+
+    def test_batch(self):
+        texts = ["good", "fuck", "good fuck"]
+        self.assertEqual(
+            [False, True, True],
+            self.filter.contains_profanity_batch(texts, languages=["en"]),
+        )
+        self.assertEqual(
+            ["good", "####", "good ####"],
+            [
+                text.censored
+                for text in self.filter.censor_batch(texts, languages=["en"])
+            ],
+        )
+
+    def test_pickle(self):
+        self.filter.contains_profanity("good", languages=["en"])
+        profanity_filter = pickle.loads(pickle.dumps(self.filter))
+        self.assertTrue(profanity_filter.contains_profanity("fuck", languages=["en"]))
+        compiled = pickle.loads(pickle.dumps(self.filter.compile(languages=["en"])))
+        self.assertEqual("####", compiled.censor("fuck").censored)
+
+    def test_weakref_and_patching(self):
+        self.assertIs(self.filter, weakref.ref(self.filter)())
+        compiled = self.filter.compile(languages=["en"])
+        self.assertIs(compiled, weakref.ref(compiled)())
+        with mock.patch.object(self.filter, "censor_word") as censor_word:
+            self.filter.censor_word("fuck")
+        censor_word.assert_called_once_with("fuck")
+
+    def test_compiled_cache_bounded(self):
+        for i in range(100):
+            self.filter.contains_profanity("good", custom_patterns=[f"foo{i}"])
+        self.assertLessEqual(len(self.filter._compiled_cache), 32)
+        self.assertLessEqual(len(self.filter._pattern_sets_cache), 32)
+
     def test_add_custom_patterns(self):
         custom_patterns = ["foobar"]
         self.filter.add_custom_profanity_patterns(custom_patterns, [])
@@ -55,6 +216,14 @@ class TestProfanityFilter(unittest.TestCase):
             )
         )
 
+    def test_add_custom_patterns_normalized(self):
+        self.filter.add_custom_profanity_patterns(["FooB@r!"], [])
+        self.assertTrue(
+            self.filter.contains_profanity(
+                "This is a foobar text.", languages=["custom"]
+            )
+        )
+
     def test_add_custom_lang(self):
         custom_patterns = ["foobar"]
         custom_exclude_patterns = ["notfoobar"]
@@ -72,6 +241,30 @@ class TestProfanityFilter(unittest.TestCase):
             )
         )
 
+    def test_extend_custom_lang(self):
+        self.filter.add_custom_language("custom_lang", ["foobar"])
+        self.filter.add_custom_language("custom_lang", exclude_patterns=["notfoobar"])
+        self.assertFalse(
+            self.filter.contains_profanity(
+                "This is a notfoobar text.", languages=["custom_lang"]
+            )
+        )
+
+    def test_extend_loaded_lang(self):
+        self.filter.add_custom_language("en", ["foobar"])
+        self.assertTrue(self.filter.contains_profanity("foobar", languages=["en"]))
+        self.assertFalse(ProfanityFilter().contains_profanity("foobar"))
+
+    def test_patterns_added_after_check(self):
+        self.filter.add_custom_language("custom_lang", ["foo"])
+        self.assertFalse(
+            self.filter.contains_profanity("bar", languages=["custom_lang"])
+        )
+        self.filter.add_custom_language("custom_lang", ["bar"])
+        self.assertTrue(
+            self.filter.contains_profanity("bar", languages=["custom_lang"])
+        )
+
     def test_censor_special_characters(self):
         text = "It's @ssh0l3."
         censored = self.filter.censor(text, languages=["en"])
@@ -86,5 +279,17 @@ class TestProfanityFilter(unittest.TestCase):
         )
 
 
+class TestProfanityFilterRegexBackend(TestProfanityFilter):
+    """
+    Runs every test with the regular expression fallback instead of Aho-Corasick.
+    """
+
+    def setUp(self):
+        patcher = mock.patch.object(matcher, "ahocorasick", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
 if __name__ == "__main__":
     unittest.main()